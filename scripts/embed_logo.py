@@ -1,5 +1,6 @@
 
 import base64
+import re
 from pathlib import Path
 
 # Paths
@@ -7,34 +8,28 @@ base_dir = Path("/Users/wcagas/Tech/avid")
 logo_path = base_dir / "src/ui/web/logo.png"
 html_path = base_dir / "src/ui/web/index.html"
 
+# Any src="logo.png" or src="logo-transparent.png"
+LOGO_SRC_PATTERN = re.compile(r'src="logo(?:-transparent)?\.png"')
+
 # Read logo
 try:
     with open(logo_path, "rb") as f:
-        logo_data = f.read()
-        b64_logo = base64.b64encode(logo_data).decode("utf-8")
+        b64_logo = base64.b64encode(memoryview(f.read())).decode("ascii")
         data_uri = f"data:image/png;base64,{b64_logo}"
 except FileNotFoundError:
     print(f"Error: logo.png not found at {logo_path}")
     exit(1)
 
 # Read HTML
-with open(html_path, "r", encoding="utf-8") as f:
-    html_content = f.read()
-
-# Replace any src="logo.png" or logo-transparent.png with base64
-targets = ['src="logo.png"', 'src="logo-transparent.png"']
-replaced = False
+html_content = html_path.read_text(encoding="utf-8")
 
-for target in targets:
-    if target in html_content:
-        html_content = html_content.replace(target, f'src="{data_uri}"')
-        replaced = True
-        print(f"Replaced {target}")
+# Replace all logo srcs with base64 in a single pass
+html_content, replaced = LOGO_SRC_PATTERN.subn(f'src="{data_uri}"', html_content)
 
 if replaced:
     # Write back
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    html_path.write_text(html_content, encoding="utf-8")
+    print(f"Replaced {replaced} logo src(s)")
     print("Logo embedded successfully.")
 else:
     print("No logo src found to replace.")
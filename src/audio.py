@@ -6,39 +6,166 @@ Uses sounddevice + NumPy for audio capture at 16kHz mono.
 Saves output as WAV file for whisper.cpp processing.
 """
 
+import contextlib
+import struct
 import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-import sounddevice as sd
-from scipy.io import wavfile
 
 from .utils import setup_logging
 
+if TYPE_CHECKING:
+    import sounddevice as sd
+
 logger = setup_logging()
 
 # Audio settings for whisper.cpp compatibility
 SAMPLE_RATE = 16000  # 16kHz
 CHANNELS = 1  # Mono
-DTYPE = np.float32  # Float32 for sounddevice
+DTYPE = np.int16  # 16-bit PCM, converted by PortAudio at capture time
+
+# Format whisper.cpp works on; other capture formats are converted before saving
+WHISPER_SAMPLE_RATE = 16000
+RESAMPLE_TAPS = 32  # Anti-aliasing FIR length used when downsampling
+
+# Recording buffer preallocated up front so the realtime callback never
+# allocates for typical dictations; grows geometrically only beyond this.
+BUFFER_SECONDS = 300  # 5 minutes
+
+# File buffer for WAV output (keeps syscall count low for long recordings)
+WAV_WRITE_BUFFER = 1 << 20  # 1 MiB
+
+
+def _write_wav(path: str, sample_rate: int, pcm: np.ndarray, channels: int = 1) -> None:
+    """
+    Write 16-bit PCM samples to a WAV file.
+    
+    Packs the 44-byte RIFF header directly and streams the samples with
+    ndarray.tofile, avoiding an intermediate bytes copy of the audio. The
+    sizes are known up front, so the final header is written first and the
+    file is never seeked back to patch it.
+    
+    Args:
+        path: Output WAV file path
+        sample_rate: Sample rate in Hz
+        pcm: 1-D int16 samples (interleaved if multi-channel)
+        channels: Number of interleaved channels (default: 1)
+    """
+    pcm = np.ascontiguousarray(pcm, dtype="<i2")
+    block_align = channels * 2
+    data_size = pcm.nbytes
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b"data", data_size
+    )
+    with Path(path).open("wb", buffering=WAV_WRITE_BUFFER) as f:
+        f.write(header)
+        pcm.tofile(f)
+
+
+def _block_amplitude(block: np.ndarray) -> float:
+    """
+    Map a flat block of int16 samples to a display amplitude (0.0 to 1.0).
+    
+    Args:
+        block: 1-D int16 samples
+    
+    Returns:
+        Loudness-curved RMS amplitude, or 0.0 below the noise floor
+    """
+    # Calculate RMS (root mean square) amplitude in a single BLAS dot
+    # product. Widen to float first so the sum of squares cannot overflow.
+    samples = block.astype(np.float32)
+    rms = (float(np.dot(samples, samples)) / samples.size) ** 0.5 / 32768.0
+
+    # Suppress very low-level background noise while idle.
+    if rms < 0.002:
+        return 0.0
+
+    # Apply a non-linear loudness curve so normal speech produces
+    # visibly larger waveform movement instead of staying tiny.
+    return min(1.0, (rms * 24.0) ** 0.65)
+
+
+def _to_whisper_pcm(pcm: np.ndarray, sample_rate: int, channels: int) -> np.ndarray:
+    """
+    Convert interleaved int16 samples to 16 kHz mono for whisper.cpp.
+    
+    Channels are averaged to mono, then the signal is low-passed with a
+    windowed-sinc FIR and linearly resampled. Audio that is already 16 kHz
+    mono is returned unchanged.
+    
+    Args:
+        pcm: 1-D int16 samples (interleaved if multi-channel)
+        sample_rate: Capture sample rate in Hz
+        channels: Number of interleaved channels
+    
+    Returns:
+        1-D int16 mono samples at WHISPER_SAMPLE_RATE
+    """
+    if channels == 1 and sample_rate == WHISPER_SAMPLE_RATE:
+        return pcm
+
+    if channels > 1:
+        x = pcm.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+    else:
+        x = pcm.astype(np.float32)
+
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        ratio = WHISPER_SAMPLE_RATE / sample_rate
+        if ratio < 1.0:
+            # Cut off at the new Nyquist frequency to avoid aliasing
+            n = np.arange(RESAMPLE_TAPS) - (RESAMPLE_TAPS - 1) / 2
+            taps = np.sinc(ratio * n) * np.hamming(RESAMPLE_TAPS)
+            x = np.convolve(x, (taps / taps.sum()).astype(np.float32), mode="same")
+
+        num_out = round(x.size * ratio)
+        positions = np.arange(num_out, dtype=np.float64) / ratio
+        x = np.interp(positions, np.arange(x.size), x)
+
+    return np.clip(np.rint(x), -32768, 32767).astype(np.int16)
 
 
 class AudioRecorder:
     """Records audio from microphone and saves to WAV file."""
 
-    def __init__(self, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS):
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        channels: int = CHANNELS,
+        on_amplitude: Callable[[float], None] | None = None
+    ):
         """
         Initialize the audio recorder.
         
         Args:
             sample_rate: Sample rate in Hz (default: 16000)
             channels: Number of channels (default: 1 for mono)
+            on_amplitude: Called from the audio thread with each recorded
+                block's amplitude (0.0 to 1.0); must not block
         """
         self.sample_rate = sample_rate
         self.channels = channels
+        self.on_amplitude = on_amplitude
+
+        # Preallocated flat recording buffer with a write cursor, both in
+        # samples. For mono (the whisper.cpp case) this is one sample per
+        # frame with no trailing channel axis.
+        self._capacity = sample_rate * channels * BUFFER_SECONDS
+        self._buf = np.empty(self._capacity, dtype=DTYPE)
+        self._write_pos = 0
+        # Amplitude of the most recent block, computed in the audio callback
+        self._amplitude = 0.0
 
-        self._frames: list[np.ndarray] = []
         self._stream: sd.InputStream | None = None
-        self._is_recording = False
+        # Read lock-free by the audio callback; self._lock guards the stream
+        # lifecycle and start/stop transitions
+        self._recording = threading.Event()
         self._lock = threading.Lock()
 
     def _audio_callback(
@@ -46,40 +173,87 @@ class AudioRecorder:
         indata: np.ndarray,
         frames: int,
         time_info: dict,
-        status: sd.CallbackFlags
+        status: "sd.CallbackFlags"
     ) -> None:
-        """Callback for audio stream - buffers incoming frames."""
+        """Callback for audio stream - copies incoming frames into the buffer."""
         if status:
-            logger.warning(f"Audio callback status: {status}")
+            # Lazy %-formatting: no string is built in the realtime thread
+            # unless the record is actually emitted
+            logger.warning("Audio callback status: %s", status)
+
+        if self._recording.is_set():
+            samples = frames * self.channels
+            pos = self._write_pos
+            end = pos + samples
+            if end > self._capacity:
+                self._capacity = max(2 * self._capacity, end)
+                self._buf = np.resize(self._buf, self._capacity)
+            self._buf[pos:end] = indata.reshape(-1)
+            self._write_pos = end
 
-        if self._is_recording:
-            self._frames.append(indata.copy())
+            amplitude = _block_amplitude(self._buf[pos:end])
+            self._amplitude = amplitude
+            on_amplitude = self.on_amplitude
+            if on_amplitude is not None:
+                with contextlib.suppress(Exception):
+                    on_amplitude(amplitude)
+
+    def _ensure_stream(self) -> None:
+        """
+        Open and start the persistent input stream if it is not running.
+        
+        The stream stays open for the lifetime of the recorder so that a PTT
+        press only has to flip the recording flag. Must hold self._lock.
+        """
+        if self._stream is None:
+            # Imported lazily: loading PortAudio is the slowest part of startup
+            import sounddevice as sd
+
+            self._stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype=DTYPE,
+                blocksize=0,
+                latency="low",
+                callback=self._audio_callback
+            )
+            self._stream.start()
+        elif not self._stream.active:
+            self._stream.start()
+
+    def open_stream(self) -> bool:
+        """
+        Pre-open the input stream so the first recording starts instantly.
+        
+        Returns:
+            True if the stream is running, False otherwise
+        """
+        with self._lock:
+            try:
+                self._ensure_stream()
+                return True
+            except Exception as e:
+                self._stream = None
+                logger.error(f"Failed to open audio stream: {e}")
+                return False
 
     def start_recording(self) -> bool:
         """Start recording audio from the microphone."""
         with self._lock:
-            if self._is_recording:
+            if self._recording.is_set():
                 logger.warning("Already recording")
                 return True
 
             try:
-                if self._stream is None:
-                    self._stream = sd.InputStream(
-                        samplerate=self.sample_rate,
-                        channels=self.channels,
-                        dtype=DTYPE,
-                        callback=self._audio_callback
-                    )
-                    self._stream.start()
-                elif not self._stream.active:
-                    self._stream.start()
-
-                self._frames = []
-                self._is_recording = True
+                self._ensure_stream()
+
+                self._write_pos = 0
+                self._amplitude = 0.0
+                self._recording.set()
                 logger.info("Recording started")
                 return True
             except Exception as e:
-                self._is_recording = False
+                self._recording.clear()
                 self._stream = None
                 logger.error(f"Failed to start recording stream: {e}")
                 return False
@@ -95,28 +269,29 @@ class AudioRecorder:
             True if audio was saved successfully, False otherwise
         """
         with self._lock:
-            if not self._is_recording:
+            if not self._recording.is_set():
                 logger.warning("Not currently recording")
                 return False
 
-            self._is_recording = False
-            stream = self._stream
-            frames_snapshot = list(self._frames)
+            self._recording.clear()
+            # Copy the captured samples under the lock: the buffer is reused,
+            # so a start_recording() during the WAV write would overwrite it
+            num_samples = self._write_pos
+            samples = self._buf[:num_samples].copy()
 
-        if not frames_snapshot:
+        if num_samples == 0:
             logger.warning("No audio frames captured")
             return False
 
-        # Concatenate all frames
-        audio_data = np.concatenate(frames_snapshot, axis=0)
-
-        # Convert float32 to int16 for WAV file
-        audio_int16 = (audio_data * 32767).astype(np.int16)
+        # Samples are already int16; at the default 16 kHz mono the buffer
+        # is written out as-is, otherwise it is converted here so the server
+        # receives fewer bytes and skips its own resampling
+        audio_data = _to_whisper_pcm(samples, self.sample_rate, self.channels)
 
         # Save as WAV
         try:
-            wavfile.write(output_path, self.sample_rate, audio_int16)
-            duration = len(audio_data) / self.sample_rate
+            _write_wav(output_path, WHISPER_SAMPLE_RATE, audio_data)
+            duration = num_samples / (self.sample_rate * self.channels)
             logger.info(f"Recording saved: {output_path} ({duration:.1f}s)")
             return True
         except Exception as e:
@@ -128,7 +303,7 @@ class AudioRecorder:
         with self._lock:
             stream = self._stream
             self._stream = None
-            self._is_recording = False
+            self._recording.clear()
 
         if stream:
             try:
@@ -144,31 +319,15 @@ class AudioRecorder:
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
-        return self._is_recording
+        return self._recording.is_set()
 
     def get_amplitude(self) -> float:
         """
         Get the current audio amplitude (0.0 to 1.0).
         
-        Uses the most recent audio frame to calculate RMS amplitude.
-        Returns 0.0 if not recording or no frames available.
+        Returns the RMS amplitude of the most recent block, computed once
+        per block in the audio callback. Returns 0.0 if not recording.
         """
-        if not self._is_recording or not self._frames:
-            return 0.0
-
-        try:
-            # Use the most recent frame
-            recent_frame = self._frames[-1]
-            # Calculate RMS (root mean square) amplitude
-            rms = float(np.sqrt(np.mean(recent_frame ** 2)))
-
-            # Suppress very low-level background noise while idle.
-            if rms < 0.002:
-                return 0.0
-
-            # Apply a non-linear loudness curve so normal speech produces
-            # visibly larger waveform movement instead of staying tiny.
-            amplitude = min(1.0, (rms * 24.0) ** 0.65)
-            return float(amplitude)
-        except Exception:
+        if not self._recording.is_set():
             return 0.0
+        return self._amplitude
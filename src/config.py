@@ -7,17 +7,65 @@ Loads settings from environment variables (.env file) with sensible defaults.
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from dotenv import load_dotenv
-
 from .utils import expand_path, setup_logging
 
 logger = setup_logging()
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load the .env file from the project root (only once per process)."""
+    from dotenv import load_dotenv
+
+    load_dotenv(Path(__file__).parent.parent / ".env")
+
+
+@lru_cache(maxsize=32)
+def _path_exists(path: str) -> bool:
+    """Check whether a path exists, caching the result per path string."""
+    return Path(path).exists()
+
+
+# Dictation modes accepted from the UI (mirrors Config.mode)
+MODES = frozenset({"default", "message", "email", "notes", "prompt"})
+
+# whisper.cpp threads when WHISPER_THREADS is unset (half the logical cores)
+DEFAULT_WHISPER_THREADS = max(1, (os.cpu_count() or 8) // 2)
+
+# Quantized model suffixes, fastest first (whisper.cpp is memory-bandwidth bound)
+QUANTIZED_SUFFIXES = ("-q5_0", "-q8_0")
+
+
+def _prefer_quantized(model_path: str) -> str:
+    """
+    Return a quantized sibling of a whisper model if one exists.
+    
+    For ggml-medium.en.bin, looks for ggml-medium.en-q5_0.bin and then
+    ggml-medium.en-q8_0.bin next to it (see scripts/quantize_model.sh).
+    
+    Args:
+        model_path: Resolved path to the configured model
+    
+    Returns:
+        Path to the quantized model, or model_path if none is found
+    """
+    path = Path(model_path)
+    if any(path.stem.endswith(suffix) for suffix in QUANTIZED_SUFFIXES):
+        return model_path
+
+    for suffix in QUANTIZED_SUFFIXES:
+        candidate = str(path.with_name(f"{path.stem}{suffix}{path.suffix}"))
+        if _path_exists(candidate):
+            logger.info(f"Using quantized whisper model: {candidate}")
+            return candidate
+    return model_path
+
+
+@dataclass(slots=True, kw_only=True)
 class Config:
     """Application configuration loaded from environment variables."""
 
@@ -28,11 +76,13 @@ class Config:
     llm_timeout: int
     llm_temperature: float
 
-    # Dictation mode
-    mode: Literal["default", "message", "email", "notes", "prompt"]
+    # Dictation mode (managed dynamically via UI, starts at default)
+    mode: Literal["default", "message", "email", "notes", "prompt"] = "default"
 
     # Auto-paste setting
     auto_paste: bool
+    # Paste formatted text sentence by sentence as the LLM streams it
+    stream_paste: bool
 
     # Whisper.cpp
     whisper_bin: str
@@ -40,53 +90,63 @@ class Config:
     whisper_port: int
     whisper_model_path: str
     whisper_timeout: int
+    whisper_threads: int
 
     # Push-to-talk key
     ptt_key: str
 
-    def __init__(self):
-        """Load configuration from environment variables."""
-        # Load .env file from project root
-        env_path = Path(__file__).parent.parent / ".env"
-        load_dotenv(env_path)
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build configuration from environment variables."""
+        _load_env()
 
         # Required settings
-        self.openai_api_key = os.getenv("OPENAI_API_KEY", "")
-        if not self.openai_api_key:
+        openai_api_key = os.environ.get("OPENAI_API_KEY", "")
+        if not openai_api_key:
             logger.warning("OPENAI_API_KEY not set - LLM formatting will be disabled")
 
-        # LLM settings
-        self.openai_api_url = os.getenv(
-            "OPENAI_API_URL",
-            "https://api.openai.com/v1/chat/completions"
-        )
-        self.llm_model = os.getenv("LLM_MODEL", "gpt-4o-mini")
-        self.llm_timeout = int(os.getenv("LLM_TIMEOUT", "30"))
-        self.llm_temperature = float(os.getenv("LLM_TEMPERATURE", "0.1"))
-
-        # Dictation mode (managed dynamically via UI, starts at default)
-        self.mode: Literal["default", "message", "email", "notes", "prompt"] = "default"
-
-        # Auto-paste
-        self.auto_paste = os.getenv("AUTO_PASTE", "false").lower() == "true"
-
-        # Whisper settings
-        self.whisper_bin = os.getenv("WHISPER_BIN", "whisper-cli")
-        self.whisper_server_bin = os.getenv("WHISPER_SERVER_BIN", "whisper-server")
-        self.whisper_port = int(os.getenv("WHISPER_PORT", "8080"))
-        whisper_model = os.getenv("WHISPER_MODEL_PATH", "~/models/whisper/ggml-medium.en-q5_0.bin")
-        self.whisper_model_path = expand_path(whisper_model)
-        self.whisper_timeout = int(os.getenv("WHISPER_TIMEOUT", "60"))
+        whisper_model = os.environ.get("WHISPER_MODEL_PATH", "~/models/whisper/ggml-medium.en-q5_0.bin")
+        whisper_model_path = expand_path(whisper_model)
+        # Opt-in: swapping models changes transcription quality
+        if os.environ.get("WHISPER_PREFER_QUANTIZED", "false").lower() == "true":
+            whisper_model_path = _prefer_quantized(whisper_model_path)
 
         # Validate whisper model exists
-        if not Path(self.whisper_model_path).exists():
-            logger.warning(f"Whisper model not found at: {self.whisper_model_path}")
-
-        # PTT key
-        self.ptt_key = os.getenv("PTT_KEY", "alt_r")
+        if not _path_exists(whisper_model_path):
+            logger.warning(f"Whisper model not found at: {whisper_model_path}")
+
+        return cls(
+            openai_api_key=openai_api_key,
+            # LLM settings
+            openai_api_url=os.environ.get(
+                "OPENAI_API_URL",
+                "https://api.openai.com/v1/chat/completions"
+            ),
+            llm_model=os.environ.get("LLM_MODEL", "gpt-4o-mini"),
+            llm_timeout=int(os.environ.get("LLM_TIMEOUT", "30")),
+            llm_temperature=float(os.environ.get("LLM_TEMPERATURE", "0.1")),
+            # Auto-paste
+            auto_paste=os.environ.get("AUTO_PASTE", "false").lower() == "true",
+            stream_paste=os.environ.get("STREAM_PASTE", "false").lower() == "true",
+            # Whisper settings
+            whisper_bin=os.environ.get("WHISPER_BIN", "whisper-cli"),
+            whisper_server_bin=os.environ.get("WHISPER_SERVER_BIN", "whisper-server"),
+            whisper_port=int(os.environ.get("WHISPER_PORT", "8080")),
+            whisper_model_path=whisper_model_path,
+            whisper_timeout=int(os.environ.get("WHISPER_TIMEOUT", "60")),
+            whisper_threads=int(os.environ.get("WHISPER_THREADS", "0")) or DEFAULT_WHISPER_THREADS,
+            # PTT key
+            ptt_key=os.environ.get("PTT_KEY", "alt_r"),
+        )
 
     def __repr__(self) -> str:
         return (
             f"Config(mode={self.mode}, auto_paste={self.auto_paste}, "
             f"ptt_key={self.ptt_key}, model={self.llm_model})"
         )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared application configuration (built on first call)."""
+    return Config.from_env()
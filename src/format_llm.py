@@ -6,6 +6,11 @@ Uses OpenAI API with strict constraints to format dictated text
 into professional emails or casual messages.
 """
 
+import json
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 from typing import Literal
 
 import requests
@@ -16,6 +21,23 @@ from .utils import setup_logging
 
 logger = setup_logging()
 
+# Max formatted results remembered for repeated utterances
+FORMAT_CACHE_SIZE = 256
+
+# Streamed output is flushed at sentence ends, or once this many chars pile up
+SENTENCE_END = re.compile(r"[.?!]\s*$")
+STREAM_FLUSH_CHARS = 80
+
+# Transcripts that are only filler words; the prompts say to output nothing
+FILLER_ONLY = re.compile(r"^(?:[\s,.!?-]*\b(?:um+|uh+|er+|hmm+|ah+|mm+)\b)+[\s,.!?-]*$", re.IGNORECASE)
+# whisper.cpp's non-speech markers for silent/noisy presses, e.g. [BLANK_AUDIO], (music)
+NON_SPEECH_ONLY = re.compile(r"^(?:\s*(?:\[[^\]]*\]|\([^)]*\)))+\s*$")
+# A single plain word (optionally with trailing punctuation) needs no cleanup
+# in these modes; message mode applies its own rules, prompt mode always
+# goes to the LLM for the CO-STAR rewrite
+SINGLE_WORD = re.compile(r"^[^\W\d_]+(?:'[^\W\d_]+)?[.,!?]?$")
+SINGLE_WORD_PASSTHROUGH_MODES = frozenset({"default", "email", "notes"})
+
 
 class Formatter:
     """Formats transcripts using OpenAI API."""
@@ -34,6 +56,19 @@ class Formatter:
         self.temperature = config.llm_temperature
         self._enabled = bool(self.api_key)
 
+        # Persistent session so the TLS connection to the API is kept alive
+        # and reused across dictations; headers are fixed for its lifetime
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # LRU of successful results keyed on (mode, stripped transcript)
+        self._cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        # Several dictations may be formatted concurrently
+        self._cache_lock = threading.Lock()
+
         if not self._enabled:
             logger.warning("Formatter disabled - no API key configured")
 
@@ -59,32 +94,22 @@ class Formatter:
             logger.info("Formatter disabled, returning raw text")
             return raw_text
 
-        # Estimate max tokens (roughly 1.5x input for some expansion room)
-        estimated_tokens = len(raw_text.split()) * 2
-        max_tokens = max(100, min(estimated_tokens, 1000))
+        trivial = self._format_trivial(raw_text, mode)
+        if trivial is not None:
+            return trivial
 
-        # Build request
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        cache_key = (mode, raw_text.strip())
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": get_system_prompt(mode)},
-                {"role": "user", "content": get_user_prompt(mode, raw_text)}
-            ],
-            "temperature": self.temperature,
-            "max_tokens": max_tokens
-        }
+        payload = self._build_payload(raw_text, mode)
 
         logger.info(f"Formatting ({mode} mode): {len(raw_text)} chars")
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.api_url,
-                headers=headers,
                 json=payload,
                 timeout=self.timeout
             )
@@ -99,6 +124,10 @@ class Formatter:
             logger.info(f"OpenAI Usage: {prompt_tok} prompt + {comp_tok} completion tokens")
 
             logger.info(f"Formatted: {len(formatted)} chars")
+
+            # Only successful results are cached; failures fall through
+            # to the raw text below and are retried next time
+            self._cache_put(cache_key, formatted)
             return formatted
 
         except requests.Timeout:
@@ -114,6 +143,166 @@ class Formatter:
             logger.error(f"Formatter unexpected error: {e}")
             return raw_text
 
+    def format_stream(self, raw_text: str, mode: str) -> Iterator[str]:
+        """
+        Format raw transcript using the LLM, yielding output as it streams.
+        
+        Text is yielded in sentence-sized chunks so callers can start using
+        the first sentence before the completion finishes. Cached results,
+        a disabled formatter, or a failure before any output yield a single
+        chunk (the cached text or raw_text).
+        
+        Args:
+            raw_text: Raw speech-to-text transcript
+            mode: Formatting mode
+        
+        Yields:
+            Consecutive chunks of the formatted text
+        """
+        if not raw_text.strip() or not self._enabled:
+            yield raw_text
+            return
+
+        trivial = self._format_trivial(raw_text, mode)
+        if trivial is not None:
+            if trivial:
+                yield trivial
+            return
+
+        cache_key = (mode, raw_text.strip())
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        payload = self._build_payload(raw_text, mode)
+        payload["stream"] = True
+
+        logger.info(f"Formatting ({mode} mode, streaming): {len(raw_text)} chars")
+
+        chunks: list[str] = []
+        pending = ""
+        try:
+            with self._session.post(
+                self.api_url,
+                json=payload,
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+
+                for line in response.iter_lines():
+                    if not line.startswith(b"data: "):
+                        continue
+                    data = line[6:]
+                    if data == b"[DONE]":
+                        break
+
+                    # Usage/keep-alive chunks (e.g. from proxies) carry no choices
+                    choices = json.loads(data).get("choices")
+                    if not choices:
+                        continue
+                    delta = choices[0]["delta"].get("content")
+                    if not delta:
+                        continue
+                    pending += delta
+                    if not chunks:
+                        pending = pending.lstrip()
+                    if pending and (SENTENCE_END.search(pending) or len(pending) > STREAM_FLUSH_CHARS):
+                        chunks.append(pending)
+                        yield pending
+                        pending = ""
+
+        except requests.RequestException as e:
+            logger.error(f"Formatter API error: {e}")
+        except (ValueError, KeyError, IndexError) as e:
+            logger.error(f"Formatter stream parsing error: {e}")
+        else:
+            pending = pending.rstrip()
+            if pending:
+                chunks.append(pending)
+                yield pending
+
+            formatted = "".join(chunks)
+            logger.info(f"Formatted: {len(formatted)} chars")
+            if formatted:
+                self._cache_put(cache_key, formatted)
+            return
+
+        # Failed: fall back to raw text if nothing was produced yet
+        if not chunks:
+            logger.error("Formatter stream failed - returning raw text")
+            yield raw_text
+
+    def _format_trivial(self, raw_text: str, mode: str) -> str | None:
+        """
+        Handle transcripts too short to be worth an LLM round trip.
+        
+        Args:
+            raw_text: Raw speech-to-text transcript
+            mode: Formatting mode
+        
+        Returns:
+            "" for filler-only or non-speech-marker input, a single plain
+            word formatted per the mode's rules (as-is, or lowercase without
+            trailing punctuation in message mode), or None if the transcript
+            should go to the LLM
+        """
+        text = raw_text.strip()
+        if FILLER_ONLY.match(text):
+            logger.info("Transcript is only filler, skipping LLM")
+            return ""
+        if NON_SPEECH_ONLY.match(text):
+            logger.info("Transcript is only non-speech markers, skipping LLM")
+            return ""
+        if SINGLE_WORD.match(text):
+            if mode in SINGLE_WORD_PASSTHROUGH_MODES:
+                logger.info("Transcript too short, skipping LLM")
+                return text
+            if mode == "message":
+                # Message mode: all lowercase, no trailing punctuation
+                logger.info("Transcript too short, skipping LLM")
+                return text.lower().rstrip(".,!?")
+        return None
+
+    def _build_payload(self, raw_text: str, mode: str) -> dict:
+        """Build the chat completion request body."""
+        # Estimate max tokens (roughly 1.5x input for some expansion room)
+        estimated_tokens = len(raw_text.split()) * 2
+        max_tokens = max(100, min(estimated_tokens, 1000))
+
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": get_system_prompt(mode)},
+                {"role": "user", "content": get_user_prompt(mode, raw_text)}
+            ],
+            "temperature": self.temperature,
+            "max_tokens": max_tokens
+        }
+
+    def _cache_get(self, cache_key: tuple[str, str]) -> str | None:
+        """Look up a cached result, marking it as recently used."""
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info(f"Formatter cache hit ({cache_key[0]} mode)")
+        return cached
+
+    def _cache_put(self, cache_key: tuple[str, str], formatted: str) -> None:
+        """Cache a successful result, evicting the least recently used."""
+        with self._cache_lock:
+            self._cache[cache_key] = formatted
+            if len(self._cache) > FORMAT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Forget all cached formatting results."""
+        with self._cache_lock:
+            self._cache.clear()
+
     @property
     def enabled(self) -> bool:
         """Check if formatter is enabled."""
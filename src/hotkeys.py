@@ -5,48 +5,79 @@ HotkeyListener component for push-to-talk functionality.
 Uses pynput to detect global key press/release events for PTT.
 """
 
-from collections.abc import Callable
-
-from pynput import keyboard
-from pynput.keyboard import Key, KeyCode
+import functools
+import logging
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from .utils import setup_logging
 
+if TYPE_CHECKING:
+    from pynput import keyboard
+    from pynput.keyboard import Key, KeyCode
+
 logger = setup_logging()
 
-# Mapping of key names to pynput Key objects
-KEY_MAP = {
-    # Special keys
-    "alt_r": Key.alt_r,
-    "alt_l": Key.alt_l,
-    "ctrl_r": Key.ctrl_r,
-    "ctrl_l": Key.ctrl_l,
-    "shift_r": Key.shift_r,
-    "shift_l": Key.shift_l,
-    "cmd_r": Key.cmd_r,
-    "cmd_l": Key.cmd_l,
-    # Function keys
-    "f1": Key.f1,
-    "f2": Key.f2,
-    "f3": Key.f3,
-    "f4": Key.f4,
-    "f5": Key.f5,
-    "f6": Key.f6,
-    "f7": Key.f7,
-    "f8": Key.f8,
-    "f9": Key.f9,
-    "f10": Key.f10,
-    "f11": Key.f11,
-    "f12": Key.f12,
-    "f13": Key.f13,
-    "f14": Key.f14,
-    "f15": Key.f15,
-    "f16": Key.f16,
-    "f17": Key.f17,
-    "f18": Key.f18,
-    "f19": Key.f19,
-    "f20": Key.f20,
-}
+
+@functools.cache
+def get_key_map() -> Mapping[str, "Key"]:
+    """
+    Return the mapping of lowercase key names to pynput Key objects.
+    
+    Built on first use so pynput is only imported once a listener is needed.
+    """
+    from pynput.keyboard import Key
+
+    return MappingProxyType({
+        # Special keys
+        "alt_r": Key.alt_r,
+        "alt_l": Key.alt_l,
+        "ctrl_r": Key.ctrl_r,
+        "ctrl_l": Key.ctrl_l,
+        "shift_r": Key.shift_r,
+        "shift_l": Key.shift_l,
+        "cmd_r": Key.cmd_r,
+        "cmd_l": Key.cmd_l,
+        # Function keys
+        "f1": Key.f1,
+        "f2": Key.f2,
+        "f3": Key.f3,
+        "f4": Key.f4,
+        "f5": Key.f5,
+        "f6": Key.f6,
+        "f7": Key.f7,
+        "f8": Key.f8,
+        "f9": Key.f9,
+        "f10": Key.f10,
+        "f11": Key.f11,
+        "f12": Key.f12,
+        "f13": Key.f13,
+        "f14": Key.f14,
+        "f15": Key.f15,
+        "f16": Key.f16,
+        "f17": Key.f17,
+        "f18": Key.f18,
+        "f19": Key.f19,
+        "f20": Key.f20,
+    })
+
+
+@functools.cache
+def resolve_key(key_name: str) -> "Key | KeyCode":
+    """Resolve key name to pynput Key or KeyCode."""
+    from pynput.keyboard import Key, KeyCode
+
+    key = get_key_map().get(key_name.lower())
+    if key is not None:
+        return key
+
+    # Single character key
+    if len(key_name) == 1:
+        return KeyCode.from_char(key_name)
+
+    logger.warning(f"Unknown key '{key_name}', defaulting to alt_r")
+    return Key.alt_r
 
 
 class HotkeyListener:
@@ -66,53 +97,68 @@ class HotkeyListener:
             on_press: Callback for key press
             on_release: Callback for key release
         """
-        self.ptt_key = self._resolve_key(ptt_key)
-        self.ptt_key_name = ptt_key
+        self._set_key(ptt_key)
         self.on_press_callback = on_press
         self.on_release_callback = on_release
 
         self._listener: keyboard.Listener | None = None
         self._key_held = False
 
-    def _resolve_key(self, key_name: str) -> Key | KeyCode:
-        """Resolve key name to pynput Key or KeyCode."""
-        key_lower = key_name.lower()
+    def _set_key(self, ptt_key: str) -> None:
+        """Resolve and store the PTT key used by the event callbacks."""
+        from pynput.keyboard import Key
 
-        if key_lower in KEY_MAP:
-            return KEY_MAP[key_lower]
+        self.ptt_key = resolve_key(ptt_key)
+        self.ptt_key_name = ptt_key
+        # Special keys are enum singletons and can be matched by identity
+        self._ptt_is_special = isinstance(self.ptt_key, Key)
 
-        # Single character key
-        if len(key_name) == 1:
-            return KeyCode.from_char(key_name)
+    def set_ptt_key(self, ptt_key: str) -> None:
+        """
+        Change the PTT key without rebuilding the listener.
+        
+        Matching happens in our own callbacks, so the running pynput
+        listener (and its macOS event tap) is kept as-is.
+        
+        Args:
+            ptt_key: New key name (e.g., "alt_r", "f18")
+        """
+        if resolve_key(ptt_key) == self.ptt_key:
+            return
 
-        logger.warning(f"Unknown key '{key_name}', defaulting to alt_r")
-        return Key.alt_r
+        self._key_held = False
+        self._set_key(ptt_key)
+        logger.info(f"PTT key changed to: {self.ptt_key_name}")
 
-    def _matches_ptt_key(self, key: Key | KeyCode) -> bool:
+    def _matches_ptt_key(self, key: "Key | KeyCode") -> bool:
         """Check if the pressed key matches the PTT key."""
+        if self._ptt_is_special:
+            return key is self.ptt_key
         return key == self.ptt_key
 
-    def _on_press(self, key: Key | KeyCode | None) -> None:
+    def _on_press(self, key: "Key | KeyCode | None") -> None:
         """Handle key press events."""
         if key is None:
             return
 
         if self._matches_ptt_key(key) and not self._key_held:
             self._key_held = True
-            logger.debug(f"PTT key pressed: {self.ptt_key_name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("PTT key pressed: %s", self.ptt_key_name)
             try:
                 self.on_press_callback()
             except Exception as e:
                 logger.error(f"Error in on_press callback: {e}")
 
-    def _on_release(self, key: Key | KeyCode | None) -> None:
+    def _on_release(self, key: "Key | KeyCode | None") -> None:
         """Handle key release events."""
         if key is None:
             return
 
         if self._matches_ptt_key(key) and self._key_held:
             self._key_held = False
-            logger.debug(f"PTT key released: {self.ptt_key_name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("PTT key released: %s", self.ptt_key_name)
             try:
                 self.on_release_callback()
             except Exception as e:
@@ -124,6 +170,8 @@ class HotkeyListener:
             logger.warning("Listener already running")
             return
 
+        from pynput import keyboard
+
         self._listener = keyboard.Listener(
             on_press=self._on_press,
             on_release=self._on_release
@@ -5,20 +5,168 @@ Injector component for outputting formatted text.
 Copies text to clipboard (always) and optionally pastes via ⌘V.
 """
 
+import ctypes
+import ctypes.util
+import functools
 import subprocess
 import time
 
 from .utils import setup_logging
 
+# Virtual key codes are physical key positions (kVK_ANSI_V = 9 is only "v"
+# on QWERTY), so the code that types "v" is looked up in the current
+# keyboard layout (Dvorak, AZERTY, ...) before each paste.
+# Virtual key codes scanned when looking up a character in the layout
+MAX_KEY_CODE = 128
+# UCKeyTranslate arguments: kUCKeyActionDisplay, kUCKeyTranslateNoDeadKeysMask
+UC_KEY_ACTION_DISPLAY = 3
+UC_NO_DEAD_KEYS = 1
+
+# Pasteboard change-count polling before auto-paste (worst case ~40 ms)
+CHANGE_POLL_ATTEMPTS = 20
+CHANGE_POLL_INTERVAL = 0.002
+
 logger = setup_logging()
 
 
+@functools.cache
+def _quartz():
+    """
+    Import PyObjC Quartz on first paste (it is slow to load).
+    
+    Returns:
+        The Quartz module, or None if PyObjC Quartz is not installed
+    """
+    try:
+        import Quartz
+    except ImportError:
+        # PyObjC Quartz not installed - fall back to osascript
+        return None
+    return Quartz
+
+
+@functools.cache
+def _carbon() -> tuple[ctypes.CDLL, ctypes.CDLL, ctypes.c_void_p] | None:
+    """
+    Load the Carbon/CoreFoundation calls used to read the keyboard layout.
+    
+    Returns:
+        (Carbon, CoreFoundation, kTISPropertyUnicodeKeyLayoutData), or None
+        if they are unavailable (e.g. not on macOS)
+    """
+    carbon_path = ctypes.util.find_library("Carbon")
+    cf_path = ctypes.util.find_library("CoreFoundation")
+    if carbon_path is None or cf_path is None:
+        return None
+    try:
+        carbon = ctypes.cdll.LoadLibrary(carbon_path)
+        cf = ctypes.cdll.LoadLibrary(cf_path)
+    except OSError:
+        return None
+
+    carbon.TISCopyCurrentKeyboardLayoutInputSource.restype = ctypes.c_void_p
+    carbon.TISGetInputSourceProperty.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    carbon.TISGetInputSourceProperty.restype = ctypes.c_void_p
+    carbon.LMGetKbdType.restype = ctypes.c_uint8
+    carbon.UCKeyTranslate.argtypes = [
+        ctypes.c_void_p,                    # keyLayoutPtr
+        ctypes.c_uint16,                    # virtualKeyCode
+        ctypes.c_uint16,                    # keyAction
+        ctypes.c_uint32,                    # modifierKeyState
+        ctypes.c_uint32,                    # keyboardType
+        ctypes.c_uint32,                    # keyTranslateOptions
+        ctypes.POINTER(ctypes.c_uint32),    # deadKeyState
+        ctypes.c_ulong,                     # maxStringLength
+        ctypes.POINTER(ctypes.c_ulong),     # actualStringLength
+        ctypes.POINTER(ctypes.c_uint16),    # unicodeString
+    ]
+    carbon.UCKeyTranslate.restype = ctypes.c_int32
+    cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+    cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+
+    layout_key = ctypes.c_void_p.in_dll(carbon, "kTISPropertyUnicodeKeyLayoutData")
+    return carbon, cf, layout_key
+
+
+def _key_code_for_char(char: str) -> int | None:
+    """
+    Find the virtual key code that types a character in the current layout.
+    
+    Args:
+        char: Single character to look up (unshifted)
+    
+    Returns:
+        The key code, or None if the layout cannot be read or has no such key
+    """
+    libs = _carbon()
+    if libs is None:
+        return None
+    carbon, cf, layout_key = libs
+
+    source = carbon.TISCopyCurrentKeyboardLayoutInputSource()
+    if not source:
+        return None
+    try:
+        data = carbon.TISGetInputSourceProperty(source, layout_key)
+        if not data:
+            return None
+        layout = cf.CFDataGetBytePtr(data)
+        kbd_type = carbon.LMGetKbdType()
+
+        dead_keys = ctypes.c_uint32(0)
+        length = ctypes.c_ulong(0)
+        chars = (ctypes.c_uint16 * 4)()
+        target = ord(char)
+        for key_code in range(MAX_KEY_CODE):
+            status = carbon.UCKeyTranslate(
+                layout, key_code, UC_KEY_ACTION_DISPLAY, 0, kbd_type,
+                UC_NO_DEAD_KEYS, ctypes.byref(dead_keys), len(chars),
+                ctypes.byref(length), chars
+            )
+            if status == 0 and length.value == 1 and chars[0] == target:
+                return key_code
+        return None
+    finally:
+        cf.CFRelease(source)
+
+
 class Injector:
     """Injects text into clipboard and optionally pastes."""
 
+    def __init__(self):
+        """Acquire the general pasteboard once, if PyObjC is available."""
+        self._pasteboard = None
+        self._string_type = None
+        try:
+            # Imported here rather than at module level so importing this
+            # module (e.g. for --help) does not load AppKit
+            from AppKit import NSPasteboard, NSPasteboardTypeString
+        except ImportError:
+            # PyObjC not installed - fall back to pbcopy
+            return
+
+        try:
+            self._pasteboard = NSPasteboard.generalPasteboard()
+            self._string_type = NSPasteboardTypeString
+        except Exception as e:
+            logger.warning(f"NSPasteboard unavailable, using pbcopy: {e}")
+
+    def _change_count(self) -> int | None:
+        """Return the pasteboard change count, or None if unavailable."""
+        if self._pasteboard is None:
+            return None
+        try:
+            return self._pasteboard.changeCount()
+        except Exception:
+            return None
+
     def copy_to_clipboard(self, text: str) -> bool:
         """
-        Copy text to the macOS clipboard using pbcopy.
+        Copy text to the macOS clipboard.
+        
+        Writes through NSPasteboard in-process when available, otherwise
+        falls back to a pbcopy subprocess.
         
         Args:
             text: Text to copy
@@ -26,15 +174,28 @@ class Injector:
         Returns:
             True if successful, False otherwise
         """
+        if self._pasteboard is not None:
+            try:
+                self._pasteboard.clearContents()
+                if self._pasteboard.setString_forType_(text, self._string_type):
+                    logger.info(f"Copied to clipboard: {len(text)} chars")
+                    return True
+                logger.warning("NSPasteboard write failed, trying pbcopy")
+            except Exception as e:
+                logger.warning(f"NSPasteboard error, trying pbcopy: {e}")
+
+        return self._pbcopy(text)
+
+    def _pbcopy(self, text: str) -> bool:
+        """Copy text to the clipboard via a pbcopy subprocess."""
         try:
-            process = subprocess.Popen(
+            result = subprocess.run(
                 ["pbcopy"],
-                stdin=subprocess.PIPE,
-                text=True
+                input=text.encode("utf-8"),
+                check=False
             )
-            process.communicate(input=text)
 
-            if process.returncode == 0:
+            if result.returncode == 0:
                 logger.info(f"Copied to clipboard: {len(text)} chars")
                 return True
             else:
@@ -50,13 +211,40 @@ class Injector:
 
     def paste(self) -> bool:
         """
-        Simulate ⌘V paste using osascript.
+        Simulate ⌘V paste.
         
-        Requires Accessibility permissions for the running app.
+        Posts the key events directly via Quartz when available, using the
+        key that types "v" in the current keyboard layout. Falls back to
+        osascript (which is layout-aware itself) if Quartz is missing or the
+        layout cannot be read. Requires Accessibility permissions for the
+        running app.
         
         Returns:
             True if successful, False otherwise
         """
+        key_code = None
+        quartz = _quartz()
+        if quartz is not None:
+            try:
+                key_code = _key_code_for_char("v")
+            except Exception as e:
+                logger.warning(f"Keyboard layout lookup failed: {e}")
+
+        if key_code is not None:
+            try:
+                for key_down in (True, False):
+                    event = quartz.CGEventCreateKeyboardEvent(None, key_code, key_down)
+                    quartz.CGEventSetFlags(event, quartz.kCGEventFlagMaskCommand)
+                    quartz.CGEventPost(quartz.kCGHIDEventTap, event)
+                logger.info("Paste triggered")
+                return True
+            except Exception as e:
+                logger.warning(f"CGEvent paste error, trying osascript: {e}")
+
+        return self._osascript_paste()
+
+    def _osascript_paste(self) -> bool:
+        """Simulate ⌘V via System Events in an osascript subprocess."""
         script = '''
         tell application "System Events"
             keystroke "v" using command down
@@ -96,11 +284,20 @@ class Injector:
         Returns:
             True if clipboard copy succeeded
         """
+        before = self._change_count()
         success = self.copy_to_clipboard(text)
 
         if success and auto_paste:
-            # Small delay to ensure clipboard is ready
-            time.sleep(0.1)
+            if before is None:
+                # No pasteboard handle: give pbcopy a moment to land
+                time.sleep(0.1)
+            else:
+                # Paste as soon as the pasteboard reports the new contents
+                # (usually immediately, since NSPasteboard writes are sync)
+                for _ in range(CHANGE_POLL_ATTEMPTS):
+                    if self._change_count() != before:
+                        break
+                    time.sleep(CHANGE_POLL_INTERVAL)
             self.paste()
 
         return success
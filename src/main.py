@@ -12,12 +12,14 @@ Orchestrates all components:
 """
 
 import argparse
+import contextlib
 import signal
-import sys
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from .audio import AudioRecorder
-from .config import Config
+from .config import get_config
 from .format_llm import Formatter
 from .hotkeys import HotkeyListener
 from .inject import Injector
@@ -27,6 +29,12 @@ from .utils import get_temp_audio_path, setup_logging
 
 logger = setup_logging()
 
+# Pause between streamed paste chunks (seconds)
+STREAM_PASTE_GAP = 0.05
+
+# Utterances whose LLM formatting may be in flight at once
+LLM_MAX_IN_FLIGHT = 4
+
 
 class DictationApp:
     """Main application orchestrating all dictation components."""
@@ -40,36 +48,43 @@ class DictationApp:
         """
         logger.info("Initializing AI Voice Dictation...")
 
-        self.config = Config()
+        self.config = get_config()
         
         # Start Whisper Server
         self.server = WhisperServer(self.config)
         self.server.start()
         
         self.audio = AudioRecorder()
+        self.audio.open_stream()
         self.transcriber = Transcriber(self.config)
         self.formatter = Formatter(self.config)
         self.injector = Injector()
 
+        # Formatting runs off the hotkey thread so the next dictation can be
+        # recorded and transcribed while earlier LLM requests are in flight
+        self._format_pool = ThreadPoolExecutor(
+            max_workers=LLM_MAX_IN_FLIGHT,
+            thread_name_prefix="format"
+        )
+        # Most recently submitted job; each job pastes only after its
+        # predecessor so results land in dictation order
+        self._last_job: Future | None = None
+        # Dictations submitted but not yet finished; only the last one to
+        # finish updates the overlay
+        self._pending_jobs = 0
+        self._jobs_lock = threading.Lock()
+
+        # One fixed WAV path, overwritten by every recording
+        self._temp_path = get_temp_audio_path()
+
         self.hotkey_listener: HotkeyListener | None = None
-        self._running = False
+        self._stop_event = threading.Event()
+        self._signals_installed = False
         self._use_ui = use_ui
         self._ui = None  # Type: DictationWindow (lazy import in run_with_ui)
         self._play_start_sound = lambda: None
         self._play_stop_sound = lambda: None
 
-        # For tracking amplitude during recording
-        self._amplitude_thread: threading.Thread | None = None
-        self._recording = False
-
-    def _update_amplitude(self) -> None:
-        """Update UI with audio amplitude while recording."""
-        import time
-        while self._recording and self._ui:
-            amplitude = self.audio.get_amplitude()
-            self._ui.update_waveform(amplitude)
-            time.sleep(0.05)  # 20 FPS
-
     def on_ptt_press(self) -> None:
         """Handle PTT key press - start recording."""
         logger.info("🎤 Recording...")
@@ -83,33 +98,12 @@ class DictationApp:
         # Start recording
         if not self.audio.start_recording():
             logger.warning("Failed to start recording")
-            if self._ui:
-                self._ui.hide()
+            self._hide_unless_pending()
             return
-        self._recording = True
-
-        # Start amplitude tracking for UI
-        if self._ui:
-            # Ensure previous thread is cleaned up
-            if self._amplitude_thread and self._amplitude_thread.is_alive():
-                self._recording = False
-                self._amplitude_thread.join(timeout=1.0)
-
-            self._amplitude_thread = threading.Thread(
-                target=self._update_amplitude,
-                daemon=True
-            )
-            self._amplitude_thread.start()
 
     def on_ptt_release(self) -> None:
         """Handle PTT key release - process audio pipeline."""
-        self._recording = False
-        
-        # Wait for amplitude thread to finish
-        if self._amplitude_thread and self._amplitude_thread.is_alive():
-            self._amplitude_thread.join(timeout=1.0)
-
-        temp_path = get_temp_audio_path()
+        temp_path = self._temp_path
 
         # Play stop sound
         if self._use_ui:
@@ -118,8 +112,7 @@ class DictationApp:
         # Stop recording and save audio
         if not self.audio.stop_recording(temp_path):
             logger.warning("No audio recorded")
-            if self._ui:
-                self._ui.hide()
+            self._hide_unless_pending()
             return
 
         # Show processing state
@@ -132,82 +125,180 @@ class DictationApp:
 
         if not raw_text or not raw_text.strip():
             logger.warning("No transcript produced")
-            if self._ui:
-                self._ui.hide()
+            self._hide_unless_pending()
             return
 
-        logger.info(f"Raw: {raw_text[:100]}...")
+        logger.info("Raw: %.100s...", raw_text)
 
-        # Skip formatter for very short transcripts (likely noise/blank)
-        if len(raw_text.strip()) < 3:
-            logger.info("Transcript too short, skipping formatter")
-            formatted_text = raw_text.strip()
-        else:
-            # Format with LLM
-            logger.info(f"✨ Formatting ({self.config.mode} mode)...")
-            formatted_text = self.formatter.format(raw_text, self.config.mode)
+        with self._jobs_lock:
+            self._pending_jobs += 1
+        self._last_job = self._format_pool.submit(
+            self._format_and_inject,
+            raw_text,
+            self.config.mode,
+            self._last_job
+        )
 
-        logger.info(f"Formatted: {formatted_text[:100]}...")
+    def _format_and_inject(self, raw_text: str, mode: str, previous: Future | None) -> None:
+        """
+        Format a transcript and inject it (runs on the format pool).
+        
+        Several of these may be formatting concurrently; injection waits for
+        the previous job so pastes keep the order of the dictations.
+        
+        Args:
+            raw_text: Raw transcript
+            mode: Formatting mode at the time of the dictation
+            previous: Job for the preceding dictation, if any
+        """
+        # Stream the LLM output straight into the focused app if enabled
+        stream = self.config.auto_paste and self.config.stream_paste
+        success = False
+
+        try:
+            # Skip formatter for very short transcripts (likely noise/blank)
+            if len(raw_text.strip()) < 3:
+                logger.info("Transcript too short, skipping formatter")
+                formatted_text = raw_text.strip()
+                stream = False
+            elif stream:
+                # Streaming pastes as it goes, so it has to wait its turn first
+                self._wait_for(previous)
+                # Format with LLM, pasting each sentence as it arrives
+                logger.info("✨ Formatting (%s mode, streaming)...", mode)
+                formatted_text = self._stream_and_paste(raw_text, mode)
+            else:
+                # Format with LLM
+                logger.info("✨ Formatting (%s mode)...", mode)
+                formatted_text = self.formatter.format(raw_text, mode)
+
+            logger.info("Formatted: %.100s...", formatted_text)
+
+            if not formatted_text:
+                logger.info("Nothing to inject")
+                return
+
+            if not stream:
+                self._wait_for(previous)
+                # Inject to clipboard (and optionally paste)
+                logger.info("📋 Copying to clipboard...")
+                self.injector.inject(formatted_text, self.config.auto_paste)
+
+            success = True
+            logger.info("✅ Done!")
+        except Exception as e:
+            logger.error(f"Error formatting dictation: {e}")
+        finally:
+            self._finish_job(success)
+
+    def _hide_unless_pending(self) -> None:
+        """Hide the overlay, or show processing if earlier jobs are still running."""
+        if not self._ui:
+            return
+        with self._jobs_lock:
+            pending = self._pending_jobs
+        if pending:
+            self._ui.show_processing()
+        else:
+            self._ui.hide()
 
-        # Inject to clipboard (and optionally paste)
-        logger.info("📋 Copying to clipboard...")
-        self.injector.inject(formatted_text, self.config.auto_paste)
+    def _finish_job(self, success: bool) -> None:
+        """
+        Mark a format job as finished and update the overlay.
+        
+        Jobs can finish while later dictations are still formatting; those
+        leave the overlay in its processing state so an early success or
+        hide does not cover work that is still in flight.
+        
+        Args:
+            success: Whether the job injected any text
+        """
+        with self._jobs_lock:
+            self._pending_jobs -= 1
+            last = self._pending_jobs == 0
 
-        # Show success
-        if self._ui:
+        # Leave the overlay alone if the next dictation is being recorded
+        if not last or not self._ui or self.audio.is_recording:
+            return
+        if success:
             self._ui.show_success()
-        logger.info("✅ Done!")
-
-    def _run_hotkey_listener(self) -> None:
-        """Run the hotkey listener in a background thread."""
-        self.hotkey_listener = HotkeyListener(
-            ptt_key=self.config.ptt_key,
-            on_press=self.on_ptt_press,
-            on_release=self.on_ptt_release
-        )
-        self.hotkey_listener.start()
-        self.hotkey_listener.wait()
+        else:
+            self._ui.hide()
 
-    def run(self) -> None:
-        """Start the application main loop (CLI mode)."""
-        self._running = True
+    @staticmethod
+    def _wait_for(job: Future | None) -> None:
+        """Block until a previous format job has finished, ignoring its outcome."""
+        if job is not None:
+            with contextlib.suppress(Exception):
+                job.result()
 
-        # Set up hotkey listener
+    def _stream_and_paste(self, raw_text: str, mode: str) -> str:
+        """
+        Paste streamed formatter output chunk by chunk.
+        
+        Returns:
+            The full formatted text, which is left on the clipboard
+        """
+        chunks: list[str] = []
+        for chunk in self.formatter.format_stream(raw_text, mode):
+            if chunks:
+                # Let the target app consume the previous paste before the
+                # clipboard is overwritten
+                time.sleep(STREAM_PASTE_GAP)
+            self.injector.inject(chunk, auto_paste=True)
+            chunks.append(chunk)
+
+        formatted_text = "".join(chunks)
+        if len(chunks) > 1:
+            time.sleep(STREAM_PASTE_GAP)
+            self.injector.copy_to_clipboard(formatted_text)
+        return formatted_text
+
+    def _start_hotkeys_nonblocking(self) -> None:
+        """Create and start the hotkey listener (runs on pynput's own thread)."""
         self.hotkey_listener = HotkeyListener(
             ptt_key=self.config.ptt_key,
             on_press=self.on_ptt_press,
             on_release=self.on_ptt_release
         )
-
-        # Handle Ctrl+C gracefully
-        def signal_handler(signum, frame):
-            logger.info("\nShutting down...")
-            self.stop()
-            sys.exit(0)
-
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-
-        # Start listening
         self.hotkey_listener.start()
 
+    def _log_banner(self, title: str, quit_hint: str) -> None:
+        """Log the startup banner with the active settings."""
         logger.info("=" * 50)
-        logger.info("AI Voice Dictation is running!")
+        logger.info(title)
         logger.info(f"Mode: {self.config.mode}")
         logger.info(f"PTT Key: {self.config.ptt_key}")
         logger.info(f"Auto-paste: {self.config.auto_paste}")
         logger.info("=" * 50)
         logger.info("Hold PTT key to record, release to process.")
-        logger.info("Press Ctrl+C to quit.")
+        logger.info(quit_hint)
+
+    def run(self) -> None:
+        """Start the application main loop (CLI mode)."""
+        # Handle Ctrl+C gracefully: the handler only wakes the main thread,
+        # which then shuts everything down outside of signal context
+        def signal_handler(signum, frame):
+            logger.info("\nShutting down...")
+            self._stop_event.set()
+
+        if not self._signals_installed:
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
+            self._signals_installed = True
+
+        # Start listening
+        self._start_hotkeys_nonblocking()
+        self._log_banner("AI Voice Dictation is running!", "Press Ctrl+C to quit.")
 
         # Block until stopped
-        self.hotkey_listener.wait()
+        self._stop_event.wait()
+        self.stop()
 
     def run_with_ui(self) -> None:
         """Start the application with UI overlay (webview on main thread)."""
         from .ui import DictationWindow, play_start_sound, play_stop_sound
 
-        self._running = True
         self._play_start_sound = play_start_sound
         self._play_stop_sound = play_stop_sound
 
@@ -224,30 +315,24 @@ class DictationApp:
         )
         self._ui.create_window()
 
-        # Start hotkey listener in background thread
-        hotkey_thread = threading.Thread(
-            target=self._run_hotkey_listener,
-            daemon=True
-        )
-        hotkey_thread.start()
+        # Waveform updates are pushed from the audio stream per block
+        self.audio.on_amplitude = self._ui.update_waveform
 
-        logger.info("=" * 50)
-        logger.info("AI Voice Dictation is running (UI mode)!")
-        logger.info(f"Mode: {self.config.mode}")
-        logger.info(f"PTT Key: {self.config.ptt_key}")
-        logger.info(f"Auto-paste: {self.config.auto_paste}")
-        logger.info("=" * 50)
-        logger.info("Hold PTT key to record, release to process.")
-        logger.info("Close the overlay window to quit.")
+        # pynput runs the listener on its own background thread
+        self._start_hotkeys_nonblocking()
+        self._log_banner(
+            "AI Voice Dictation is running (UI mode)!",
+            "Close the overlay window to quit."
+        )
 
         # Run webview on main thread (this blocks!)
         self._ui.start()
 
     def stop(self) -> None:
         """Stop the application."""
-        self._running = False
-        self._recording = False
+        self._stop_event.set()
         self.audio.shutdown()
+        self._format_pool.shutdown(wait=False, cancel_futures=True)
         if self.hotkey_listener:
             self.hotkey_listener.stop()
         if self._ui:
@@ -114,13 +114,30 @@ PROMPT_MODE_PROMPT = """Refine this raw voice input into a structured AI prompt
 Raw Voice Input: {transcript}"""
 
 
+# --- Mode dispatch ---
+
+_SYSTEM_PROMPTS = {
+    "prompt": PROMPT_ENGINEER_SYSTEM_PROMPT,
+    "notes": NOTES_MODE_SYSTEM_PROMPT,
+}
+
+# User prompt templates pre-split around {transcript} into (before, after)
+# so building a prompt is two concatenations instead of a str.format parse
+_USER_TEMPLATES = {
+    mode: template.partition("{transcript}")[::2]
+    for mode, template in {
+        "email": EMAIL_MODE_PROMPT,
+        "message": MESSAGE_MODE_PROMPT,
+        "prompt": PROMPT_MODE_PROMPT,
+        "notes": NOTES_MODE_PROMPT,
+    }.items()
+}
+_DEFAULT_USER_TEMPLATE = DEFAULT_MODE_PROMPT.partition("{transcript}")[::2]
+
+
 def get_system_prompt(mode: str) -> str:
     """Get the appropriate system prompt for the mode."""
-    if mode == "prompt":
-        return PROMPT_ENGINEER_SYSTEM_PROMPT
-    elif mode == "notes":
-        return NOTES_MODE_SYSTEM_PROMPT
-    return CLEANUP_SYSTEM_PROMPT
+    return _SYSTEM_PROMPTS.get(mode, CLEANUP_SYSTEM_PROMPT)
 
 
 def get_user_prompt(mode: str, transcript: str) -> str:
@@ -134,13 +151,5 @@ def get_user_prompt(mode: str, transcript: str) -> str:
     Returns:
         Formatted user prompt string
     """
-    if mode == "email":
-        return EMAIL_MODE_PROMPT.format(transcript=transcript)
-    elif mode == "message":
-        return MESSAGE_MODE_PROMPT.format(transcript=transcript)
-    elif mode == "prompt":
-        return PROMPT_MODE_PROMPT.format(transcript=transcript)
-    elif mode == "notes":
-        return NOTES_MODE_PROMPT.format(transcript=transcript)
-    else:
-        return DEFAULT_MODE_PROMPT.format(transcript=transcript)
+    before, after = _USER_TEMPLATES.get(mode, _DEFAULT_USER_TEMPLATE)
+    return before + transcript + after
@@ -1,6 +1,11 @@
 
+import io
+import re
 import subprocess
+import threading
 import time
+import wave
+from collections import deque
 import requests
 import socket
 from pathlib import Path
@@ -9,6 +14,16 @@ from .utils import setup_logging
 
 logger = setup_logging()
 
+# whisper-server prints this once the model is loaded and the socket is bound
+READY_PATTERN = re.compile(r"listening (?:at|on)")
+# Server output lines kept for the error log if startup fails
+LOG_TAIL_LINES = 20
+
+# Readiness wait: overall deadline and exponential backoff between probes (seconds)
+READY_TIMEOUT = 10.0
+READY_POLL_MIN = 0.02
+READY_POLL_MAX = 0.2
+
 class WhisperServer:
     """Manages the background whisper-server process."""
     
@@ -16,6 +31,9 @@ class WhisperServer:
         self.config = config
         self.process: subprocess.Popen | None = None
         self.url = f"http://127.0.0.1:{config.whisper_port}"
+        # Set by the output drain thread when the server reports it is listening
+        self._ready = threading.Event()
+        self._log_tail: deque[str] = deque(maxlen=LOG_TAIL_LINES)
 
     def is_port_open(self) -> bool:
         """Check if the server port is open."""
@@ -32,6 +50,7 @@ class WhisperServer:
             self.config.whisper_server_bin,
             "-m", self.config.whisper_model_path,
             "--port", str(self.config.whisper_port),
+            "-t", str(self.config.whisper_threads),
             "--host", "127.0.0.1" 
             # Actually, standard whisper-server might auto-detect metal on mac. 
             # Let's check if --ng is needed explicitly or just safe. 
@@ -44,34 +63,82 @@ class WhisperServer:
         logger.info(f"Starting Whisper Server: {' '.join(cmd)}")
         
         try:
-            # Start process, redirect output to /dev/null/logger to avoid clutter?
-            # ideally we want to capture it. For now let's just let it inherit stdout/stderr 
-            # but maybe that messes up the TUI? 
-            # Better to PIPE and log? Or just PIPE and ignore if we trust it works.
-            # Let's PIPE stdout/stderr to avoid polluting the terminal UI of existing app
-            
+            # PIPE stdout/stderr and forward them to the debug log, so the
+            # terminal stays clean but startup failures can be diagnosed
+            self._ready.clear()
+            self._log_tail.clear()
             self.process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.DEVNULL, 
-                stderr=subprocess.DEVNULL
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True,
+                # Undecodable bytes must not kill the drain thread, or the
+                # pipe fills up and the server blocks on writes
+                errors="replace"
             )
+            threading.Thread(target=self._drain, args=(self.process,), daemon=True).start()
             
             # Wait for it to be ready
             logger.info("Waiting for server to be ready...")
-            for _ in range(20): # 10 seconds timeout
-                if self.is_port_open():
+            delay = READY_POLL_MIN
+            deadline = time.monotonic() + READY_TIMEOUT
+            while True:
+                # The ready log line can sit in the server's block-buffered
+                # stdout pipe, so a (cheap, loopback) port probe backs it up
+                if self._ready.is_set() or self.is_port_open():
                     logger.info("Whisper server is ready!")
+                    threading.Thread(target=self._warm_up, daemon=True).start()
                     return
-                time.sleep(0.5)
                 if self.process.poll() is not None:
                     logger.error("Whisper server failed to start")
                     break
-            
-            logger.error("Timed out waiting for server")
+                if time.monotonic() >= deadline:
+                    logger.error("Timed out waiting for server")
+                    break
+                # Returns as soon as the server logs that it is listening
+                self._ready.wait(delay)
+                delay = min(delay * 1.5, READY_POLL_MAX)
+
+            for line in self._log_tail:
+                logger.error(f"whisper-server: {line}")
             
         except Exception as e:
             logger.error(f"Failed to start whisper server: {e}")
 
+    def _drain(self, process: subprocess.Popen) -> None:
+        """Forward server output to the debug log and watch for readiness."""
+        for line in process.stdout:
+            line = line.rstrip()
+            if not line:
+                continue
+            self._log_tail.append(line)
+            logger.debug(f"whisper-server: {line}")
+            if not self._ready.is_set() and READY_PATTERN.search(line):
+                self._ready.set()
+
+    def _warm_up(self) -> None:
+        """Run one tiny inference so the first real utterance hits a warm model."""
+        # 1 second of 16 kHz mono 16-bit silence
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(bytes(32000))
+
+        start = time.monotonic()
+        try:
+            requests.post(
+                f"{self.url}/inference",
+                files={"file": ("warmup.wav", buffer.getvalue(), "audio/wav")},
+                data={"response_format": "json"},
+                timeout=30
+            )
+            logger.info(f"Whisper warmup done in {time.monotonic() - start:.2f}s")
+        except requests.RequestException as e:
+            logger.warning(f"Whisper warmup failed: {e}")
+
     def stop(self) -> None:
         """Stop the server."""
         if self.process:
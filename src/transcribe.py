@@ -2,23 +2,72 @@
 """
 Transcriber component for converting audio to text using whisper.cpp.
 
-Invokes whisper-cpp CLI with the audio file and parses the output.
+Posts the audio file to the local whisper-server over a persistent
+keep-alive HTTP connection and parses the output.
 """
 
-import os
-import subprocess
+import random
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import Config
 from .utils import setup_logging
 
 logger = setup_logging()
 
+# Retries for connection failures and gateway errors, e.g. while
+# whisper-server is (re)starting; backoff is 0.1 s, 0.2 s, ... plus jitter.
+# Read timeouts are never retried: the request reached the server, and
+# re-POSTing would queue duplicate inferences behind its single worker.
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.1
+RETRY_JITTER = 0.05
+RETRY_STATUSES = (502, 503, 504)
+
+
+class _JitteredRetry(Retry):
+    """Retry policy that adds random jitter to each backoff sleep."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, RETRY_JITTER) if backoff else backoff
+
+
+# The upload form never changes between requests, so its multipart framing
+# is encoded once with a fixed boundary
+MULTIPART_BOUNDARY = "avid-whisper-upload"
+UPLOAD_FILENAME = "audio.wav"
+
+
+def _multipart_frame(fields: dict[str, str], filename: str) -> tuple[bytes, bytes]:
+    """
+    Encode the multipart/form-data framing around a single WAV file part.
+    
+    Args:
+        fields: Plain form fields sent ahead of the file
+        filename: Filename reported for the file part
+    
+    Returns:
+        (prefix, suffix) bytes to place before and after the file contents
+    """
+    boundary = f"--{MULTIPART_BOUNDARY}\r\n"
+    prefix = "".join(
+        f'{boundary}Content-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+        for name, value in fields.items()
+    )
+    prefix += (
+        f'{boundary}Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: audio/wav\r\n\r\n"
+    )
+    suffix = f"\r\n--{MULTIPART_BOUNDARY}--\r\n"
+    return prefix.encode(), suffix.encode()
+
 
 class Transcriber:
-    """Transcribes audio files using whisper.cpp CLI."""
+    """Transcribes audio files using the whisper.cpp server."""
 
     def __init__(self, config: Config):
         """
@@ -32,8 +81,37 @@ class Transcriber:
         self.model_path = config.whisper_model_path
         self.timeout = config.whisper_timeout
 
-        # Get number of CPU cores for threading (use half)
-        self.threads = max(1, os.cpu_count() // 2) if os.cpu_count() else 4
+        self.threads = config.whisper_threads
+
+        # Persistent session: the TCP connection to whisper-server is kept
+        # alive and reused for every utterance
+        self._session = requests.Session()
+        retry = _JitteredRetry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            read=False,
+            other=0,
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False
+        )
+        self._session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        )
+        self._session.headers["Connection"] = "keep-alive"
+
+        self._form_prefix, self._form_suffix = _multipart_frame(
+            {
+                "response_format": "json",
+                "temperature": "0.0",
+                "no_speech_thold": "0.6"
+            },
+            UPLOAD_FILENAME
+        )
+        self._form_headers = {
+            "Content-Type": f"multipart/form-data; boundary={MULTIPART_BOUNDARY}"
+        }
 
     def transcribe(self, audio_path: str) -> str:
         """
@@ -55,39 +133,30 @@ class Transcriber:
         logger.info(f"Transcribing via server: {audio_path}")
         
         try:
-            with open(audio_file, 'rb') as f:
-                files = {'file': f}
-                # response_format='text' creates simpler output, or json for more details
-                # whisper.cpp server usually takes multipart/form-data
-                response = requests.post(
-                    url, 
-                    files=files, 
-                    data={'response_format': 'text'},
-                    timeout=self.timeout
-                )
-            
-            if response.status_code == 200:
-                transcript = response.text.strip()
-                # If json is returned despite requesting text, parse it
-                # But standard whisper-server output depends on implementation. 
-                # Let's assume text for now based on typical usage, 
-                # or we can parse JSON if it returns that.
-                # Actually, whisper.cpp server default might be JSON. 
-                # Let's try to parse JSON if it looks like it.
-                
-                try:
-                    data = response.json()
-                    if 'text' in data:
-                        transcript = data['text'].strip()
-                except Exception:
-                    pass # It was probably plain text
-                
-                logger.info(f"Transcription complete: {len(transcript)} chars")
-                return transcript
-            else:
-                logger.error(f"Server error {response.status_code}: {response.text}")
-                return ""
+            # whisper.cpp server takes multipart/form-data; the body is the
+            # pre-encoded framing around the WAV bytes. It is sent as one
+            # in-memory bytes object so connection retries can resend it
+            # (a few hundred KB for a typical dictation).
+            body = b"".join((self._form_prefix, audio_file.read_bytes(), self._form_suffix))
+            response = self._session.post(
+                url,
+                data=body,
+                headers=self._form_headers,
+                timeout=self.timeout
+            )
+
+            response.raise_for_status()
 
+            transcript = response.json().get("text", "").strip()
+            logger.info(f"Transcription complete: {len(transcript)} chars")
+            return transcript
+
+        except requests.HTTPError as e:
+            logger.error(f"Server error {e.response.status_code}: {e.response.text}")
+            return ""
+        except requests.Timeout:
+            logger.error(f"Whisper server did not respond within {self.timeout}s")
+            return ""
         except requests.exceptions.ConnectionError:
             logger.error("Could not connect to Whisper server. Is it running?")
             return ""
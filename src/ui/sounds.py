@@ -1,6 +1,7 @@
 # sounds.py
 """Audio feedback for recording start/stop."""
 
+import functools
 import subprocess
 from pathlib import Path
 
@@ -8,16 +9,54 @@ from pathlib import Path
 SOUNDS_DIR = Path(__file__).parent / "web" / "sounds"
 
 
+@functools.cache
+def _get_player(filename: str):
+    """
+    Load and prepare an in-process player for a sound file (once per file).
+    
+    Returns:
+        A prepared AVAudioPlayer, or None if unavailable
+    """
+    try:
+        # Imported here so importing the ui package does not load PyObjC
+        from AVFoundation import AVAudioPlayer
+        from Foundation import NSURL
+    except ImportError:
+        # PyObjC AVFoundation not installed - fall back to afplay
+        return None
+
+    sound_path = SOUNDS_DIR / filename
+    if not sound_path.exists():
+        return None
+
+    try:
+        url = NSURL.fileURLWithPath_(str(sound_path))
+        player, _error = AVAudioPlayer.alloc().initWithContentsOfURL_error_(url, None)
+        if player is not None:
+            player.prepareToPlay()
+        return player
+    except Exception:
+        return None
+
+
 def play_sound(filename: str, volume: float = 1.0) -> None:
     """
-    Play a sound file using macOS afplay.
+    Play a sound file.
     
-    Non-blocking: sound plays in background.
+    Non-blocking: sound plays in background. Uses a preloaded AVAudioPlayer
+    when available, otherwise macOS afplay.
     
     Args:
         filename: Name of the sound file in the sounds directory
-        volume: Volume multiplier (default 1.0)
+        volume: Volume from 0.0 to 1.0 (default 1.0)
     """
+    player = _get_player(filename)
+    if player is not None:
+        player.setVolume_(volume)
+        player.setCurrentTime_(0)
+        player.play()
+        return
+
     sound_path = SOUNDS_DIR / filename
     if sound_path.exists():
         # Use afplay (macOS built-in) - non-blocking with &
@@ -29,8 +68,8 @@ def play_sound(filename: str, volume: float = 1.0) -> None:
 
 
 def play_start_sound() -> None:
-    """Play the recording start sound (louder)."""
-    play_sound("start.wav", volume=5.0)
+    """Play the recording start sound (the asset itself is mastered louder)."""
+    play_sound("start.wav", volume=1.0)
 
 
 def play_stop_sound() -> None:
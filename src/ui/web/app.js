@@ -10,18 +10,26 @@ const modeBadge = document.getElementById('mode-badge');
 const waveformCanvas = document.getElementById('waveform');
 const ctx = waveformCanvas.getContext('2d');
 
+// Modes in toggle order
+const MODES = ['default', 'message', 'email', 'notes', 'prompt'];
+
 // State
 let currentMode = 'default';
 let autoPaste = false;
 let waveformBars = new Array(20).fill(0);
 let animationFrame = null;
 
+// Latest amplitude, assigned directly by Python (`__amp=0.42`) and
+// consumed by the draw loop on the next animation frame
+window.__amp = null;
+
 // Initialize on load
 document.addEventListener('DOMContentLoaded', async () => {
     // Get initial state from Python
     if (window.pywebview && window.pywebview.api) {
         try {
-            const state = await window.pywebview.api.get_state();
+            // Sent pre-serialized by Python
+            const state = JSON.parse(await window.pywebview.api.get_state());
             currentMode = state.mode;
             autoPaste = state.auto_paste;
             updateModeDisplay();
@@ -82,12 +90,8 @@ function showMenu() {
 
 // Toggle between modes
 async function toggleMode() {
-    let newMode;
-    if (currentMode === 'default') newMode = 'message';
-    else if (currentMode === 'message') newMode = 'email';
-    else if (currentMode === 'email') newMode = 'notes';
-    else if (currentMode === 'notes') newMode = 'prompt';
-    else newMode = 'default';
+    // Unknown modes wrap to the first entry (indexOf -1 + 1 = 0)
+    const newMode = MODES[(MODES.indexOf(currentMode) + 1) % MODES.length];
 
     currentMode = newMode;
 
@@ -113,7 +117,7 @@ function updateMenuDisplay() {
     if (modeLabel) modeLabel.textContent = currentMode.toUpperCase();
 
     if (modeControl) {
-        modeControl.classList.remove('show-default', 'show-email', 'show-message', 'show-prompt', 'show-notes');
+        modeControl.classList.remove(...MODES.map((mode) => `show-${mode}`));
         modeControl.classList.add(`show-${currentMode}`);
     }
 }
@@ -184,6 +188,12 @@ function startWaveformAnimation() {
     if (animationFrame) cancelAnimationFrame(animationFrame);
 
     function draw() {
+        // Take the latest amplitude pushed from Python, if any
+        if (window.__amp !== null) {
+            updateWaveform(window.__amp);
+            window.__amp = null;
+        }
+
         // Clear canvas
         ctx.clearRect(0, 0, waveformCanvas.width, waveformCanvas.height);
 
@@ -260,13 +270,10 @@ function updateModeDisplay() {
     modeBadge.textContent = currentMode.toUpperCase();
 
     // Reset classes
-    modeBadge.classList.remove('default', 'message', 'prompt', 'notes');
+    modeBadge.classList.remove(...MODES);
 
     // Add active class based on mode
-    if (currentMode === 'default') modeBadge.classList.add('default');
-    else if (currentMode === 'message') modeBadge.classList.add('message');
-    else if (currentMode === 'prompt') modeBadge.classList.add('prompt');
-    else if (currentMode === 'notes') modeBadge.classList.add('notes');
+    if (MODES.includes(currentMode)) modeBadge.classList.add(currentMode);
 }
 
 // External API for Python
@@ -280,6 +287,22 @@ function updateAutoPaste(enabled) {
     autoPaste = enabled;
 }
 
+// State names accepted by applyBatch
+const STATES = {
+    idle: showIdle,
+    recording: showRecording,
+    processing: showProcessing,
+    success: showSuccess,
+};
+
+// Apply a batch of updates from Python in one call:
+// {m: mode, a: autoPaste, s: state}
+function applyBatch(batch) {
+    if ('m' in batch) updateMode(batch.m);
+    if ('a' in batch) updateAutoPaste(batch.a);
+    if ('s' in batch && STATES[batch.s]) STATES[batch.s]();
+}
+
 // Expose functions to window for pywebview
 window.showIdle = showIdle;
 window.showRecording = showRecording;
@@ -288,3 +311,4 @@ window.showProcessing = showProcessing;
 window.showSuccess = showSuccess;
 window.updateMode = updateMode;
 window.updateAutoPaste = updateAutoPaste;
+window.applyBatch = applyBatch;
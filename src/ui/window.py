@@ -1,43 +1,109 @@
 # window.py
 """Pywebview-based overlay window for dictation feedback."""
 
-import queue
+import contextlib
+import functools
+import json
+import sys
 import threading
+import time
+from collections import deque
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import webview
+from ..config import MODES
+
+if TYPE_CHECKING:
+    import webview
 
 # Path to web assets
 WEB_DIR = Path(__file__).parent / "web"
+# Plain path (not a file:// URI) so pywebview serves the page through its
+# built-in HTTP server
+WEB_INDEX_PATH = str(WEB_DIR / "index.html")
+
+# Max waveform pushes to JS per second while recording
+WAVEFORM_FPS = 30
+
+# Waveform levels are sent as whole percentages (0-100)
+WAVEFORM_LEVELS = 100
+
+# Window for coalescing queued UI updates into one evaluate_js (seconds)
+JS_BATCH_DELAY = 0.005
+
+
+@functools.lru_cache(maxsize=WAVEFORM_LEVELS + 1)
+def _waveform_js(level: int) -> str:
+    """Return the (cached) script that hands a waveform level to the page."""
+    return "__amp=%.2f" % (level / WAVEFORM_LEVELS)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_screen_size() -> tuple[int, int]:
+    """
+    Return the main screen's (width, height), looked up once per process.
+    
+    Falls back to 1920x1080 if AppKit is unavailable.
+    """
+    try:
+        from AppKit import NSScreen
+        size = NSScreen.mainScreen().frame().size
+        return int(size.width), int(size.height)
+    except Exception:
+        # Fallback dimensions
+        return 1920, 1080
 
 
 class Api:
     """JavaScript API bridge for the overlay window."""
 
+    # Called on every JS -> Python call, so keep attribute access cheap
+    __slots__ = (
+        "_auto_paste",
+        "_mode",
+        "_on_auto_paste_change",
+        "_on_mode_change",
+        "_on_ui_state_change",
+        "_state_json",
+    )
+
     def __init__(self, on_mode_change: Callable | None = None,
                  on_auto_paste_change: Callable | None = None):
         self._mode = "email"
         self._auto_paste = False
         self._on_mode_change = on_mode_change
         self._on_auto_paste_change = on_auto_paste_change
+        self._on_ui_state_change: Callable[[str], None] | None = None
+        self._refresh_state()
 
-    def get_state(self) -> dict:
-        """Get current app state for the UI."""
-        return {
+    def _refresh_state(self) -> None:
+        """Re-serialize the state returned by get_state (call on every change)."""
+        self._state_json = json.dumps({
             "mode": self._mode,
             "auto_paste": self._auto_paste
-        }
+        })
+
+    def get_state(self) -> str:
+        """Get current app state for the UI as a JSON string."""
+        return self._state_json
 
     def set_mode(self, mode: str) -> None:
-        """Set the current mode."""
+        """Set the current mode (unknown modes from the page are ignored)."""
+        # Interned so later equality checks against the literals hit the
+        # identity fast path
+        mode = sys.intern(mode)
+        if mode not in MODES:
+            return
         self._mode = mode
+        self._refresh_state()
         if self._on_mode_change:
             self._on_mode_change(mode)
 
     def set_auto_paste(self, enabled: bool) -> None:
         """Set auto-paste setting."""
         self._auto_paste = enabled
+        self._refresh_state()
         if self._on_auto_paste_change:
             self._on_auto_paste_change(enabled)
 
@@ -45,10 +111,11 @@ class Api:
         """Update internal state (called from Python side)."""
         self._mode = mode
         self._auto_paste = auto_paste
+        self._refresh_state()
 
     def set_ui_state(self, state: str) -> None:
         """Request window resize based on UI state ('idle' or 'expanded')."""
-        if hasattr(self, '_on_ui_state_change') and self._on_ui_state_change:
+        if self._on_ui_state_change:
             self._on_ui_state_change(state)
 
 
@@ -82,11 +149,26 @@ class DictationWindow:
         self._api.update_state(mode, auto_paste)
 
         self._window: webview.Window | None = None
-        self._command_queue: queue.Queue = queue.Queue()
+        # (field, JS literal) updates waiting for the next batched flush,
+        # applied by the page's applyBatch(). deque append and popleft are
+        # atomic, so producers and the flusher never contend on it; the lock
+        # only guards scheduling the flush timer.
+        self._command_queue: deque[tuple[str, str]] = deque()
+        self._command_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Serializes flushes so batches reach the page in queue order
+        self._flush_lock = threading.Lock()
         self._ready = threading.Event()
         self._screen_width = 1920
         self._screen_height = 1080
 
+        # Single-slot latest waveform amplitude (None once pushed). The audio
+        # thread only stores into it; a pump thread drains it at
+        # WAVEFORM_FPS while the recording state is shown.
+        self._amplitude: float | None = None
+        self._waveform_active = threading.Event()
+        self._waveform_thread: threading.Thread | None = None
+
     def _handle_ui_state_change(self, state: str) -> None:
         """Resize and reposition window based on UI state within current screen bounds."""
         if not self._window:
@@ -136,15 +218,38 @@ class DictationWindow:
         self._window.resize(new_w, new_h)
         self._window.move(int(new_x), int(new_y))
 
-    def _process_commands(self) -> None:
-        """Process queued JS commands (called from webview thread)."""
-        while True:
-            try:
-                cmd = self._command_queue.get_nowait()
-                if cmd and self._window:
-                    self._window.evaluate_js(cmd)
-            except queue.Empty:
-                break
+    def _flush_js(self, trailing: str | None = None) -> None:
+        """
+        Apply all queued UI updates in a single evaluate_js call.
+        
+        Updates are merged into one applyBatch({...}) object, so a later
+        value for the same field replaces an earlier one.
+        
+        Args:
+            trailing: Optional statement appended after the batch in the
+                same call (used by the waveform pump)
+        """
+        with self._flush_lock:
+            with self._command_lock:
+                self._flush_scheduled = False
+
+            # Anything queued after the flag is cleared either makes it into
+            # this drain or schedules the next flush
+            batch: dict[str, str] = {}
+            queue = self._command_queue
+            while queue:
+                field, literal = queue.popleft()
+                batch[field] = literal
+
+            commands = []
+            if batch:
+                fields = ",".join(f"{field}:{literal}" for field, literal in batch.items())
+                commands.append(f"applyBatch({{{fields}}})")
+            if trailing is not None:
+                commands.append(trailing)
+            if commands and self._window:
+                with contextlib.suppress(Exception):
+                    self._window.evaluate_js(";".join(commands))
 
     def _on_loaded(self) -> None:
         """Called when the webview page is loaded."""
@@ -153,15 +258,7 @@ class DictationWindow:
     def create_window(self) -> None:
         """Create the webview window. Must be called before start()."""
         # Get screen dimensions to position at bottom center
-        try:
-            from AppKit import NSScreen
-            screen = NSScreen.mainScreen()
-            screen_width = int(screen.frame().size.width)
-            screen_height = int(screen.frame().size.height)
-        except Exception:
-            # Fallback dimensions
-            screen_width = 1920
-            screen_height = 1080
+        screen_width, screen_height = _get_screen_size()
 
         self._screen_width = screen_width
         self._screen_height = screen_height
@@ -172,9 +269,13 @@ class DictationWindow:
         x = (screen_width - window_width) // 2
         y = screen_height - window_height - 30  # 30px from bottom
 
+        # Imported lazily: pywebview pulls in PyObjC/WebKit, which is only
+        # needed once a window is actually created
+        import webview
+
         self._window = webview.create_window(
             title='AI Voice Dictation',
-            url=str(WEB_DIR / "index.html"),
+            url=WEB_INDEX_PATH,
             width=window_width,
             height=window_height,
             x=x,
@@ -188,6 +289,42 @@ class DictationWindow:
         )
         self._window.events.loaded += self._on_loaded
 
+        if self._waveform_thread is None:
+            self._waveform_thread = threading.Thread(
+                target=self._pump_waveform,
+                daemon=True
+            )
+            self._waveform_thread.start()
+
+    def _pump_waveform(self) -> None:
+        """
+        Push the latest amplitude to JS at most WAVEFORM_FPS times a second.
+        
+        The value is assigned to the page's __amp global rather than passed
+        to a function; the canvas draw loop consumes it on its next frame.
+        Any queued state commands ride along in the same evaluate_js, so
+        while recording there is one bridge round trip per frame.
+        """
+        interval = 1.0 / WAVEFORM_FPS
+        next_tick = time.monotonic()
+        while True:
+            self._waveform_active.wait()
+            # Ticks run on a fixed monotonic schedule, so time spent in
+            # evaluate_js does not stretch the frame interval (and there is
+            # no catch-up burst after an idle period)
+            now = time.monotonic()
+            next_tick = max(next_tick + interval, now)
+            time.sleep(next_tick - now)
+
+            amplitude = self._amplitude
+            if amplitude is None or not self._window:
+                continue
+            self._amplitude = None
+
+            level = int(amplitude * WAVEFORM_LEVELS)
+            # A bare global assignment; the page's draw loop picks it up
+            self._flush_js(_waveform_js(level))
+
     def _set_app_icon(self) -> None:
         """Set the application icon in the macOS Dock."""
         try:
@@ -216,61 +353,79 @@ class DictationWindow:
         # Update the Dock icon
         self._set_app_icon()
 
+        import webview
+
         # Start the webview - this blocks!
         webview.start(debug=False)
 
-    def _queue_js(self, js: str) -> None:
-        """Queue a JS command to be executed."""
-        self._command_queue.put(js)
-        # Trigger processing on the webview thread
-        if self._window:
-            try:
-                self._window.evaluate_js("null")  # Wake up the event loop
-                self._process_commands()
-            except Exception:
-                pass
+    def _queue_update(self, field: str, literal: str) -> None:
+        """
+        Queue a UI update for the page's applyBatch().
+        
+        Returns immediately. Updates queued within JS_BATCH_DELAY of each
+        other are sent to the page together in one evaluate_js call.
+        
+        Args:
+            field: applyBatch field ("s" state, "m" mode, "a" auto-paste)
+            literal: Field value as a JavaScript literal
+        """
+        self._command_queue.append((field, literal))
+        with self._command_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        timer = threading.Timer(JS_BATCH_DELAY, self._flush_js)
+        timer.daemon = True
+        timer.start()
 
     def show_recording(self) -> None:
         """Show the overlay with recording state."""
-        if self._window:
-            self._window.evaluate_js("showRecording()")
+        self._amplitude = None
+        self._waveform_active.set()
+        self._queue_update("s", '"recording"')
 
     def update_waveform(self, amplitude: float) -> None:
         """
         Update the waveform visualization with current amplitude.
         
+        Non-blocking and safe to call from the audio thread: a single
+        attribute store. Values arriving faster than WAVEFORM_FPS are
+        dropped in favor of the latest.
+        
         Args:
             amplitude: Audio amplitude (0.0 to 1.0)
         """
-        if self._window:
-            self._window.evaluate_js(f"updateWaveform({amplitude})")
+        self._amplitude = amplitude
 
     def show_processing(self) -> None:
         """Show the processing spinner."""
-        if self._window:
-            self._window.evaluate_js("showProcessing()")
+        self._waveform_active.clear()
+        self._queue_update("s", '"processing"')
 
     def show_success(self) -> None:
         """Flash success indicator then return to idle."""
-        if self._window:
-            self._window.evaluate_js("showSuccess()")
+        self._waveform_active.clear()
+        self._queue_update("s", '"success"')
 
     def hide(self) -> None:
         """Return to idle state (mic icon)."""
-        if self._window:
-            self._window.evaluate_js("showIdle()")
+        self._waveform_active.clear()
+        self._queue_update("s", '"idle"')
 
     def update_mode(self, mode: str) -> None:
-        """Update the mode in the UI."""
-        self._api._mode = mode
-        if self._window:
-            self._window.evaluate_js(f"updateMode('{mode}')")
+        """Update the mode in the UI (no-op if it is already shown)."""
+        if mode == self._api._mode:
+            return
+        self._api.update_state(mode, self._api._auto_paste)
+        self._queue_update("m", json.dumps(mode))
 
     def update_auto_paste(self, auto_paste: bool) -> None:
-        """Update the auto-paste setting in the UI."""
-        self._api._auto_paste = auto_paste
-        if self._window:
-            self._window.evaluate_js(f"updateAutoPaste({str(auto_paste).lower()})")
+        """Update the auto-paste setting in the UI (no-op if unchanged)."""
+        if auto_paste == self._api._auto_paste:
+            return
+        self._api.update_state(self._api._mode, auto_paste)
+        self._queue_update("a", "true" if auto_paste else "false")
 
     def destroy(self) -> None:
         """Destroy the window."""
@@ -8,18 +8,46 @@ Common utilities used across modules:
 - Temporary file management
 """
 
+import functools
 import logging
 import os
+import tempfile
 from pathlib import Path
 
-# Default temp audio path
-TEMP_AUDIO_PATH = "/tmp/utt.wav"
+# Default temp audio path: RAM-backed /dev/shm where available (Linux),
+# otherwise the platform temp dir
+_SHM_DIR = Path("/dev/shm")
+TEMP_AUDIO_PATH = str(
+    (_SHM_DIR if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK) else Path(tempfile.gettempdir()))
+    / "utt.wav"
+)
 
 
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that formats each whole-second timestamp only once."""
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt=datefmt)
+        # (second, formatted) of the last record; datefmt has no sub-second part
+        self._last_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        second = int(record.created)
+        last_second, formatted = self._last_time
+        if second != last_second:
+            formatted = super().formatTime(record, datefmt)
+            self._last_time = (second, formatted)
+        return formatted
+
+
+@functools.cache
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
     """
     Configure and return the application logger.
     
+    Cached: every module calls this at import time, but the logger is only
+    configured on the first call.
+    
     Args:
         level: Logging level (default: INFO)
     
@@ -30,20 +58,25 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
 
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
+        formatter = _SecondCachedFormatter(
             "%(asctime)s [%(levelname)s] %(message)s",
             datefmt="%H:%M:%S"
         )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        # Our handler is the only one; skip walking up to the root logger
+        logger.propagate = False
 
     logger.setLevel(level)
     return logger
 
 
+@functools.lru_cache(maxsize=256)
 def expand_path(path: str) -> str:
     """
-    Expand ~ to home directory and resolve the path.
+    Expand ~ to home directory and make the path absolute.
+    
+    Unlike resolve(), this does not stat the path; symlinks are left as-is.
     
     Args:
         path: Path string that may contain ~
@@ -51,7 +84,7 @@ def expand_path(path: str) -> str:
     Returns:
         Expanded absolute path string
     """
-    return str(Path(os.path.expanduser(path)).resolve())
+    return str(Path(path).expanduser().absolute())
 
 
 def get_temp_audio_path() -> str:
@@ -59,9 +92,6 @@ def get_temp_audio_path() -> str:
     Return the temporary audio file path.
     
     Returns:
-        Path to temporary WAV file (/tmp/utt.wav)
+        Path to temporary WAV file (utt.wav in /dev/shm or the temp dir)
     """
     return TEMP_AUDIO_PATH
-
-
-